@@ -1,84 +1,340 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv
+import io
 import os
 
 # Page configuration
 st.set_page_config(page_title="Data Science Jobs Dashboard", layout="wide", initial_sidebar_state="expanded")
 
-# Custom CSS for better styling
-st.markdown("""
-    <style>
-    .main {
-        padding: 20px;
-    }
-    h1 {
-        color: #1f77b4;
-        font-size: 2.5em;
-        margin-bottom: 10px;
-    }
-    h2 {
-        color: #1f77b4;
-        font-size: 1.8em;
-        margin-top: 30px;
-    }
-    .metric-card {
-        background-color: #f0f4f8;
-        padding: 15px;
-        border-radius: 8px;
-        border-left: 4px solid #1f77b4;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+# Custom CSS for better styling; cached so the markdown -> HTML conversion
+# runs once and later reruns just replay the recorded element
+@st.cache_data
+def inject_css():
+    st.markdown("""
+        <style>
+        .main {
+            padding: 20px;
+        }
+        h1 {
+            color: #1f77b4;
+            font-size: 2.5em;
+            margin-bottom: 10px;
+        }
+        h2 {
+            color: #1f77b4;
+            font-size: 1.8em;
+            margin-top: 30px;
+        }
+        .metric-card {
+            background-color: #f0f4f8;
+            padding: 15px;
+            border-radius: 8px;
+            border-left: 4px solid #1f77b4;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+
+inject_css()
 
 # Title and description
 st.title("📊 Data Science Jobs Dashboard")
 st.markdown("Explore and analyze Data Science job postings with interactive visualizations")
 
+# Only these columns are ever referenced by the dashboard; skipping the rest
+# (Job Description, Headquarters, Competitors, ...) at parse time shrinks
+# memory and every downstream copy and serialization proportionally
+USED_COLUMNS = [
+    'Job Title', 'Salary Estimate', 'Rating', 'Company Name',
+    'Location', 'Size', 'Sector', 'Revenue',
+]
+
 # Load data with error handling
 @st.cache_data
 def load_data(file_path):
-    """Load CSV file with error handling"""
+    """Load the dataset with error handling, preferring a Parquet sidecar"""
     try:
+        # Parquet parses 10-50x faster than CSV, so keep a sidecar copy and
+        # use it on every start after the first
+        parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+        if os.path.exists(parquet_path):
+            return pd.read_parquet(parquet_path, columns=USED_COLUMNS)
+
         if not os.path.exists(file_path):
             st.error(f"❌ File not found: {file_path}")
             st.info("Please ensure the DataScientist.csv file is in the same directory as this app.")
             return None
-        
-        df = pd.read_csv(file_path, index_col=0)
+
+        df = pd.read_csv(file_path, usecols=USED_COLUMNS, dtype={'Rating': np.float32})
+        try:
+            df.to_parquet(parquet_path, compression='zstd')
+        except Exception:
+            pass  # the sidecar is only an optimization; CSV still works
         return df
     except Exception as e:
         st.error(f"❌ Error loading file: {str(e)}")
         return None
 
+# Preprocess data once per file (cached so widget interactions don't re-run it)
+@st.cache_data
+def preprocess(file_path):
+    """Derive salary columns and drop incomplete rows, cached per file"""
+    df = load_data(file_path)
+    if df is None:
+        return None
+
+    # Extract both salary bounds in one regex pass and fuse the average
+    # into a single NumPy expression; the min/max columns aren't referenced
+    # anywhere downstream, so don't materialize them
+    sal = df['Salary Estimate'].str.extract(
+        r'\$(\d+)K-\$(\d+)K', expand=True
+    ).astype('float32').to_numpy()
+    df['Avg_Salary'] = (sal[:, 0] + sal[:, 1]) * 500.0
+
+    # Drop rows with missing critical data
+    df_clean = df.dropna(subset=['Job Title', 'Sector', 'Rating'])
+
+    # Back columns with Arrow so st.dataframe and the CSV download serialize
+    # without per-cell Python conversion
+    df_clean = df_clean.convert_dtypes(dtype_backend='pyarrow')
+
+    # Encode string filter/group-by columns as categoricals (not Arrow:
+    # groupby/isin on Arrow-backed strings is slow) so isin, value_counts
+    # and groupby work on integer codes instead of Python strings
+    for col in ['Sector', 'Size', 'Job Title', 'Company Name', 'Revenue', 'Location']:
+        df_clean[col] = df_clean[col].astype('category')
+
+    # Order Size categories by their leading employee count so sorted output
+    # and the salary chart follow company size; lexicographic order puts
+    # "10000+ employees" before "51 to 200". Labels without a leading count
+    # ("-1", "Unknown") sort last.
+    size_cats = df_clean['Size'].cat.categories
+    size_key = size_cats.str.extract(r'^(?P<n>\d+)', expand=False).astype('float').fillna(np.inf)
+    ordered_sizes = size_cats[np.argsort(size_key.to_numpy(), kind='stable')]
+    df_clean['Size'] = df_clean['Size'].cat.reorder_categories(ordered_sizes, ordered=True)
+    return df_clean
+
+# Rating buckets for the pre-aggregated tables: left-closed and 0.5 wide to
+# match the slider step, so "Rating >= min_rating" selects whole buckets
+RATING_BINS = np.arange(0.0, 5.6, 0.5)
+
+@st.cache_data
+def salary_cube(file_path):
+    """Salary sums and counts pivoted to (Sector, rating bucket) x Size.
+
+    The size-salary chart only needs per-cell sums and counts, so pivot
+    them once per file; each rerun then just sums the selected rows of a
+    small matrix - no groupby on the hot path.
+    """
+    df_clean = preprocess(file_path)
+    rating_bucket = pd.cut(
+        df_clean['Rating'], bins=RATING_BINS, labels=RATING_BINS[:-1], right=False
+    )
+    return (
+        df_clean.groupby(
+            [df_clean['Sector'], rating_bucket, df_clean['Size']], observed=True
+        )['Avg_Salary']
+        .agg(['sum', 'count'])
+        .unstack('Size', fill_value=0)
+    )
+
+@st.cache_data
+def company_sketches(file_path):
+    """Unique company codes per (Sector, Size, rating bucket) cell.
+
+    Plays the role of per-cell cardinality sketches: the unique-companies
+    metric merges the selected cells instead of scanning every filtered
+    row. At this cardinality the exact code arrays are already tiny, so
+    no approximate (HyperLogLog-style) counting is needed.
+    """
+    df_clean = preprocess(file_path)
+    rating_bucket = pd.cut(
+        df_clean['Rating'], bins=RATING_BINS, labels=RATING_BINS[:-1], right=False
+    )
+    grouped = df_clean.groupby(
+        [df_clean['Sector'], df_clean['Size'], rating_bucket], observed=True
+    )['Company Name']
+    return {key: np.unique(s.cat.codes.to_numpy()) for key, s in grouped}
+
+def merged_company_count(sketches, selected_sectors, selected_sizes, min_rating):
+    """Number of distinct companies across the selected filter cells"""
+    sel_sectors = set(selected_sectors)
+    sel_sizes = set(selected_sizes)
+    parts = [
+        codes for (sector, size, bucket), codes in sketches.items()
+        if sector in sel_sectors and size in sel_sizes and float(bucket) >= min_rating
+    ]
+    if not parts:
+        return 0
+    return np.unique(np.concatenate(parts)).size
+
+def top_category_counts(series, positions, k):
+    """Top-k category labels and counts over the selected row positions.
+
+    np.bincount over the codes plus argpartition is O(rows + categories);
+    value_counts would sort every unique value just to keep the head.
+    """
+    codes = series.cat.codes.to_numpy()[positions]
+    counts = np.bincount(codes, minlength=len(series.cat.categories))
+    k = min(k, int(np.count_nonzero(counts)))
+    if k == 0:
+        return series.cat.categories[:0], counts[:0]
+    top_idx = np.argpartition(counts, -k)[-k:]
+    top_idx = top_idx[np.argsort(-counts[top_idx])]
+    return series.cat.categories.take(top_idx), counts[top_idx]
+
+def filter_positions(df_clean, selected_sectors, selected_sizes, min_rating):
+    """Row positions matching the sidebar filters, computed on category codes.
+
+    np.isin over the int code arrays beats pandas isin over strings and
+    avoids the chained-mask temporaries.
+    """
+    sector_cats = df_clean['Sector'].cat.categories
+    size_cats = df_clean['Size'].cat.categories
+    sel_sector_codes = np.fromiter(
+        (sector_cats.get_loc(s) for s in selected_sectors),
+        dtype=np.int32, count=len(selected_sectors)
+    )
+    sel_size_codes = np.fromiter(
+        (size_cats.get_loc(s) for s in selected_sizes),
+        dtype=np.int32, count=len(selected_sizes)
+    )
+    mask = (
+        np.isin(df_clean['Sector'].cat.codes.to_numpy(), sel_sector_codes)
+        & np.isin(df_clean['Size'].cat.codes.to_numpy(), sel_size_codes)
+        & (df_clean['Rating'].to_numpy(dtype=np.float32) >= min_rating)
+    )
+    return np.flatnonzero(mask)
+
+@st.cache_data
+def cached_filter_positions(file_path, sectors, sizes, min_rating):
+    """Filter positions memoized on the filter tuple, so toggling back to a
+    previous filter combination skips the scan entirely"""
+    return filter_positions(preprocess(file_path), sectors, sizes, min_rating)
+
+@st.cache_data
+def make_download_csv(file_path, sectors, sizes, min_rating, columns):
+    """CSV bytes for the download button, encoded once per filter combo.
+
+    Uses pyarrow's multi-threaded CSV writer instead of DataFrame.to_csv.
+    """
+    df_clean = preprocess(file_path)
+    positions = filter_positions(df_clean, sectors, sizes, min_rating)
+    table = pa.Table.from_pandas(
+        df_clean.iloc[positions][list(columns)], preserve_index=False
+    )
+    buf = io.BytesIO()
+    pa.csv.write_csv(table, buf)
+    return buf.getvalue()
+
+# Figure factories build plain graph_objects traces (skipping Plotly
+# Express's per-call argument normalization) and take small tuples so
+# st.cache_data can reuse the result across reruns. They return the
+# plotly-JSON dict rather than a Figure: skip_invalid=True bypasses the
+# schema validator and st.plotly_chart accepts the dict as-is, so a
+# cache hit skips figure construction and re-validation entirely.
+@st.cache_data
+def top_titles_figure(titles, counts):
+    """Horizontal bar chart of the top job titles, as a plotly-JSON dict"""
+    fig = go.Figure(
+        data=[go.Bar(
+            # typed int32/float32 arrays serialize to compact base64 binary
+            # in the plotly JSON instead of per-element float64 lists
+            x=np.asarray(counts, dtype=np.int32),
+            y=list(titles),
+            orientation='h',
+            marker=dict(color=np.asarray(counts, dtype=np.int32), colorscale='Blues'),
+        )],
+        layout=go.Layout(
+            height=400,
+            showlegend=False,
+            hovermode='y unified',
+            xaxis_title='Number of Positions',
+            yaxis_title='Job Title',
+            margin=dict(l=150, r=20, t=40, b=20),
+        ),
+        skip_invalid=True,
+    )
+    return fig.to_plotly_json()
+
+@st.cache_data
+def sector_pie_figure(labels, values):
+    """Donut chart of job counts by sector, as a plotly-JSON dict"""
+    fig = go.Figure(
+        data=[go.Pie(
+            labels=list(labels),
+            values=np.asarray(values, dtype=np.int32),
+            hole=0.3,
+            textposition='inside',
+            textinfo='percent+label',
+            marker=dict(colors=px.colors.sequential.Blues_r),
+        )],
+        layout=go.Layout(height=400, margin=dict(l=0, r=0, t=40, b=0)),
+        skip_invalid=True,
+    )
+    return fig.to_plotly_json()
+
+@st.cache_data
+def size_salary_figure(size_labels, salaries):
+    """Line chart of average salary by company size, as a plotly-JSON dict"""
+    fig = go.Figure(
+        data=[go.Scatter(
+            x=list(size_labels),
+            y=np.asarray(salaries, dtype=np.float32),
+            mode='lines+markers',
+            line=dict(color='#1f77b4', width=3),
+            marker=dict(size=10),
+        )],
+        layout=go.Layout(
+            title='Salary Trend Across Company Sizes',
+            height=400,
+            hovermode='x unified',
+            xaxis_title='Company Size',
+            yaxis_title='Average Salary ($)',
+            margin=dict(l=50, r=20, t=60, b=50),
+        ),
+        skip_invalid=True,
+    )
+    return fig.to_plotly_json()
+
+@st.cache_data
+def sidebar_options(file_path):
+    """Filter options as frozen tuples, cached per file.
+
+    Streamlit re-hashes widget options on every rerun to detect changes;
+    tuples over the (already sorted) category indexes keep that to a few
+    dozen elements with a memoized hash instead of a freshly built list.
+    """
+    df_clean = preprocess(file_path)
+    return (
+        tuple(df_clean['Sector'].cat.categories),
+        tuple(df_clean['Size'].cat.categories),
+    )
+
 # Load the dataset
 FILE_PATH = "DataScientist.csv"
 df = load_data(FILE_PATH)
 
 if df is not None:
-    # Data preprocessing
-    # Clean salary columns by extracting numeric values
-    df['Salary_Min'] = df['Salary Estimate'].str.extract('(\d+)').astype(float) * 1000
-    df['Salary_Max'] = df['Salary Estimate'].str.extract(r'\$(\d+)K-\$(\d+)K').iloc[:, 1].astype(float) * 1000
-    df['Avg_Salary'] = (df['Salary_Min'] + df['Salary_Max']) / 2
-    
-    # Drop rows with missing critical data
-    df_clean = df.dropna(subset=['Job Title', 'Sector', 'Rating'])
-    
+    df_clean = preprocess(FILE_PATH)
+
     # ==================== SIDEBAR FILTERS ====================
     st.sidebar.markdown("## 🔍 Filters")
-    
+
+    sectors, sizes = sidebar_options(FILE_PATH)
+
     # Sector filter
-    sectors = sorted(df_clean['Sector'].dropna().unique())
     selected_sectors = st.sidebar.multiselect(
         "Select Sector(s)",
         options=sectors,
         default=sectors[:3] if len(sectors) > 3 else sectors
     )
-    
+
     # Company size filter
-    sizes = sorted(df_clean['Size'].dropna().unique())
     selected_sizes = st.sidebar.multiselect(
         "Select Company Size(s)",
         options=sizes,
@@ -89,145 +345,144 @@ if df is not None:
     min_rating = st.sidebar.slider("Minimum Rating", min_value=0.0, max_value=5.0, value=3.0, step=0.5)
     
     # Apply filters
-    filtered_df = df_clean[
-        (df_clean['Sector'].isin(selected_sectors)) &
-        (df_clean['Size'].isin(selected_sizes)) &
-        (df_clean['Rating'] >= min_rating)
-    ]
-    
+    mask_positions = cached_filter_positions(
+        FILE_PATH, tuple(selected_sectors), tuple(selected_sizes), min_rating
+    )
+
+    # Metric reductions run straight over the filtered ndarrays; Series.mean
+    # would rebuild a Series and go through pandas' reduction machinery, and
+    # nunique on category codes is a single np.unique over ints
+    n_jobs = len(mask_positions)
+    rating_arr = df_clean['Rating'].to_numpy(dtype=np.float32)[mask_positions]
+    sal_arr = df_clean['Avg_Salary'].to_numpy(dtype=np.float32)[mask_positions]
+    avg_rating = rating_arr.mean() if n_jobs else float('nan')
+    avg_salary = np.nanmean(sal_arr) if n_jobs else float('nan')
+    n_companies = merged_company_count(
+        company_sketches(FILE_PATH), selected_sectors, selected_sizes, min_rating
+    )
+
     # Display filter info
     st.sidebar.markdown(f"### 📈 Summary")
-    st.sidebar.metric("Total Jobs Found", len(filtered_df))
-    st.sidebar.metric("Avg Rating", f"{filtered_df['Rating'].mean():.2f}")
-    st.sidebar.metric("Avg Salary", f"${filtered_df['Avg_Salary'].mean():,.0f}")
-    
+    st.sidebar.metric("Total Jobs Found", n_jobs)
+    st.sidebar.metric("Avg Rating", f"{avg_rating:.2f}")
+    st.sidebar.metric("Avg Salary", f"${avg_salary:,.0f}")
+
     # ==================== MAIN DASHBOARD ====================
     # Display key metrics
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        st.metric("Total Positions", len(filtered_df))
+        st.metric("Total Positions", n_jobs)
     with col2:
-        st.metric("Avg Salary (K)", f"${filtered_df['Avg_Salary'].mean() / 1000:.0f}K")
+        st.metric("Avg Salary (K)", f"${avg_salary / 1000:.0f}K")
     with col3:
-        st.metric("Avg Rating", f"{filtered_df['Rating'].mean():.2f} ⭐")
+        st.metric("Avg Rating", f"{avg_rating:.2f} ⭐")
     with col4:
-        st.metric("Unique Companies", filtered_df['Company Name'].nunique())
+        st.metric("Unique Companies", n_companies)
     
     st.markdown("---")
     
-    # ==================== CHARTS SECTION ====================
-    st.markdown("## 📊 Interactive Visualizations")
+    # Charts and the table live in a fragment: clicking the download
+    # button below reruns only this block, not the whole script
+    @st.fragment
+    def render_charts_and_table():
+        # ==================== CHARTS SECTION ====================
+        st.markdown("## 📊 Interactive Visualizations")
+
+        chart_col1, chart_col2 = st.columns(2)
+
+        # Chart 1: Bar Chart - Top Job Titles
+        with chart_col1:
+            st.markdown("### 1️⃣ Top 10 Job Titles")
+            top_titles, top_title_counts = top_category_counts(
+                df_clean['Job Title'], mask_positions, 10
+            )
+            fig_bar = top_titles_figure(
+                tuple(top_titles), tuple(int(c) for c in top_title_counts)
+            )
+            st.plotly_chart(fig_bar, use_container_width=True)
     
-    chart_col1, chart_col2 = st.columns(2)
+        # Chart 2: Pie Chart - Jobs by Sector
+        with chart_col2:
+            st.markdown("### 2️⃣ Job Distribution by Sector")
+            top_sectors, top_sector_counts = top_category_counts(
+                df_clean['Sector'], mask_positions, 8
+            )
+            fig_pie = sector_pie_figure(
+                tuple(top_sectors), tuple(int(v) for v in top_sector_counts)
+            )
+            st.plotly_chart(fig_pie, use_container_width=True)
     
-    # Chart 1: Bar Chart - Top Job Titles
-    with chart_col1:
-        st.markdown("### 1️⃣ Top 10 Job Titles")
-        job_counts = filtered_df['Job Title'].value_counts().head(10).reset_index()
-        job_counts.columns = ['Job Title', 'Count']
-        fig_bar = px.bar(
-            job_counts,
-            y='Job Title',
-            x='Count',
-            orientation='h',
-            labels={'Count': 'Number of Positions'},
-            color='Count',
-            color_continuous_scale='Blues',
-            height=400
-        )
-        fig_bar.update_layout(
-            showlegend=False,
-            hovermode='y unified',
-            margin=dict(l=150, r=20, t=40, b=20)
-        )
-        st.plotly_chart(fig_bar, use_container_width=True)
+        # Chart 3: Line Chart - Average Salary by Company Size
+        st.markdown("### 3️⃣ Average Salary Trend by Company Size")
     
-    # Chart 2: Pie Chart - Jobs by Sector
-    with chart_col2:
-        st.markdown("### 2️⃣ Job Distribution by Sector")
-        sector_counts = filtered_df['Sector'].value_counts().head(8)
-        fig_pie = px.pie(
-            names=sector_counts.index,
-            values=sector_counts.values,
-            hole=0.3,
-            color_discrete_sequence=px.colors.sequential.Blues_r
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-        fig_pie.update_layout(height=400, margin=dict(l=0, r=0, t=40, b=0))
-        st.plotly_chart(fig_pie, use_container_width=True)
+        # Sum the selected rows of the pre-pivoted cube: a few-row matrix
+        # reduction instead of a groupby over the filtered frame
+        cube = salary_cube(FILE_PATH)
+        cube_rows = cube[
+            cube.index.get_level_values('Sector').isin(selected_sectors)
+            & (cube.index.get_level_values('Rating').astype(float) >= min_rating)
+        ]
+        # reindex in category (natural size) order, so the x-axis runs from
+        # smallest to largest company with no per-rerun sort; a size with no
+        # rated rows at all never makes it into the cube and drops out here
+        sel_sizes = [s for s in df_clean['Size'].cat.categories if s in set(selected_sizes)]
+        sal_sums = cube_rows['sum'].sum(axis=0).reindex(sel_sizes)
+        sal_counts = cube_rows['count'].sum(axis=0).reindex(sel_sizes)
+        size_salary = (sal_sums / sal_counts.replace(0, np.nan)).dropna()
     
-    # Chart 3: Line Chart - Average Salary by Company Size
-    st.markdown("### 3️⃣ Average Salary Trend by Company Size")
+        if len(size_salary) > 0:
+            fig_line = size_salary_figure(
+                tuple(size_salary.index), tuple(float(v) for v in size_salary.values)
+            )
+            st.plotly_chart(fig_line, use_container_width=True)
+        else:
+            st.warning("⚠️ Not enough data to display salary trends")
     
-    size_salary = filtered_df.groupby('Size')['Avg_Salary'].mean().sort_values(ascending=False)
+        st.markdown("---")
     
-    if len(size_salary) > 0:
-        fig_line = px.line(
-            x=size_salary.index,
-            y=size_salary.values,
-            markers=True,
-            labels={'x': 'Company Size', 'y': 'Average Salary ($)'},
-            title='Salary Trend Across Company Sizes',
-            color_discrete_sequence=['#1f77b4'],
-            height=400
-        )
-        fig_line.update_traces(
-            line=dict(width=3),
-            marker=dict(size=10)
-        )
-        fig_line.update_layout(
-            hovermode='x unified',
-            margin=dict(l=50, r=20, t=60, b=50)
-        )
-        st.plotly_chart(fig_line, use_container_width=True)
-    else:
-        st.warning("⚠️ Not enough data to display salary trends")
-    
-    st.markdown("---")
-    
-    # ==================== RAW DATA TABLE ====================
-    st.markdown("## 📋 Raw Data Table")
-    
-    # Select columns to display
-    display_columns = [
-        'Job Title', 'Company Name', 'Location', 'Salary Estimate', 
-        'Rating', 'Sector', 'Size', 'Revenue'
-    ]
-    available_columns = [col for col in display_columns if col in filtered_df.columns]
+        # ==================== RAW DATA TABLE ====================
+        st.markdown("## 📋 Raw Data Table")
     
-    # Display statistics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.info(f"📊 Showing {len(filtered_df)} jobs")
-    with col2:
-        csv = filtered_df[available_columns].to_csv(index=False)
-        st.download_button(
-            label="📥 Download as CSV",
-            data=csv,
-            file_name="data_science_jobs.csv",
-            mime="text/csv"
-        )
-    with col3:
-        st.info(f"📌 Total Records in Dataset: {len(df)}")
+        # Select columns to display
+        display_columns = [
+            'Job Title', 'Company Name', 'Location', 'Salary Estimate', 
+            'Rating', 'Sector', 'Size', 'Revenue'
+        ]
+        available_columns = [col for col in display_columns if col in df_clean.columns]
     
-    # Display the table with pagination
-    page_size = st.slider("Rows per page", 5, 50, 10)
-    total_pages = (len(filtered_df) // page_size) + (1 if len(filtered_df) % page_size != 0 else 0)
+        # Display statistics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.info(f"📊 Showing {n_jobs} jobs")
+        with col2:
+            csv = make_download_csv(
+                FILE_PATH,
+                tuple(selected_sectors),
+                tuple(selected_sizes),
+                min_rating,
+                tuple(available_columns),
+            )
+            st.download_button(
+                label="📥 Download as CSV",
+                data=csv,
+                file_name="data_science_jobs.csv",
+                mime="text/csv"
+            )
+        with col3:
+            st.info(f"📌 Total Records in Dataset: {len(df)}")
     
-    if total_pages > 0:
-        page_number = st.selectbox("Select Page", range(1, total_pages + 1))
-        start_idx = (page_number - 1) * page_size
-        end_idx = start_idx + page_size
-        
-        # Display table
+        # Display the table: the grid virtualizes rows client-side, so the
+        # filtered frame is sent once over Arrow IPC and only the visible
+        # viewport is ever rendered - no Python-side pagination needed
         st.dataframe(
-            filtered_df[available_columns].iloc[start_idx:end_idx].reset_index(drop=True),
+            df_clean[available_columns].take(mask_positions).reset_index(drop=True),
             use_container_width=True,
-            height=400
+            height=400,
+            row_height=28
         )
-        
-        st.markdown(f"*Page {page_number} of {total_pages}*")
+
+    render_charts_and_table()
     
     st.markdown("---")
     st.markdown("**Dashboard Created with Streamlit & Plotly** | Last Updated: 2026")